@@ -10,19 +10,34 @@ import serial
 import time
 import struct
 import threading
-from enum import Enum
-from datetime import datetime
+import collections
+from array import array
+import gc
 import os
 import sys
+import logging
+import logging.handlers
+import queue
 
-# 尝试导入可选的可视化库
-try:
-    import tkinter as tk
-    from tkinter import ttk, scrolledtext
-    GUI_AVAILABLE = True
-except ImportError:
-    GUI_AVAILABLE = False
-    print("警告: tkinter不可用，将使用终端显示模式")
+# 可选的可视化库，只在使用GUI模式时才导入（终端模式不加载tkinter，缩短启动时间）
+tk = ttk = scrolledtext = None
+GUI_AVAILABLE = None  # None表示尚未尝试导入
+
+def load_gui():
+    """按需导入tkinter，返回GUI是否可用"""
+    global tk, ttk, scrolledtext, GUI_AVAILABLE
+    if GUI_AVAILABLE is None:
+        try:
+            import tkinter as tk
+            from tkinter import ttk, scrolledtext
+            GUI_AVAILABLE = True
+        except ImportError:
+            GUI_AVAILABLE = False
+            print("警告: tkinter不可用，将使用终端显示模式")
+    return GUI_AVAILABLE
+
+# 诊断信息统一经此logger输出，由RobotDataMonitor挂接后台队列，读线程不直接写终端
+logger = logging.getLogger(__name__)
 
 # --- CRC-8校验算法 ---
 crc8_table = [
@@ -44,78 +59,105 @@ crc8_table = [
     116, 42, 200, 150, 21, 75, 169, 247, 182, 232, 10, 84, 215, 137, 107, 53
 ]
 
-def checksum_crc8(data):
+def checksum_crc8(data, _table=crc8_table):
+    """计算CRC-8校验值"""
+    # _table在定义时绑定为局部变量，循环内不再查找全局名
     check = 0
     for b in data:
-        check = crc8_table[check ^ b]
+        check = _table[check ^ b]
     return check & 0xFF
 
 # --- 协议解析器 ---
-class ParseState(Enum):
-    WAIT_HEADER_1 = 1
-    WAIT_HEADER_2 = 2
-    WAIT_FUNCTION = 3
-    WAIT_LENGTH = 4
-    READ_DATA = 5
-    READ_CHECKSUM = 6
-
 class RrcProtocolParser:
-    def __init__(self):
-        self._reset()
+    HEADER = b'\xAA\x55'
+    COMPACT_THRESHOLD = 4096  # 已消费字节超过该值时才压缩缓冲区
 
-    def _reset(self):
-        self.state = ParseState.WAIT_HEADER_1
-        self.function_code = 0
-        self.data_length = 0
-        self.data_buffer = bytearray()
-        
-    def calculate_checksum(self):
-        crc_data = bytearray([self.function_code, self.data_length])
-        crc_data.extend(self.data_buffer)
-        return checksum_crc8(crc_data)
+    def __init__(self, data_store=None, crc_error_log_every=100):
+        # data_store可选：提供时由解析器统计总帧数、有效帧数和校验错误数（读线程是这三项的唯一写者）
+        self.data_store = data_store
+        self.crc_error_count = 0
+        self.crc_error_log_every = crc_error_log_every  # 每N次校验错误才打印一次原始数据
+        self._buffer = bytearray()
+        self._pos = 0
+        self._pending = collections.deque()  # parse_byte一次只返回一个包，多出的包暂存于此
 
-    def parse_byte(self, byte_in):
-        if self.state == ParseState.WAIT_HEADER_1:
-            if byte_in == 0xAA: 
-                self.state = ParseState.WAIT_HEADER_2
-        elif self.state == ParseState.WAIT_HEADER_2:
-            if byte_in == 0x55: 
-                self.state = ParseState.WAIT_FUNCTION
-            else: 
-                self._reset()
-        elif self.state == ParseState.WAIT_FUNCTION:
-            self.function_code = byte_in
-            self.state = ParseState.WAIT_LENGTH
-        elif self.state == ParseState.WAIT_LENGTH:
-            self.data_length = byte_in
-            self.data_buffer = bytearray()
-            if self.data_length == 0: 
-                self.state = ParseState.READ_CHECKSUM
-            else: 
-                self.state = ParseState.READ_DATA
-        elif self.state == ParseState.READ_DATA:
-            self.data_buffer.append(byte_in)
-            if len(self.data_buffer) == self.data_length: 
-                self.state = ParseState.READ_CHECKSUM
-        elif self.state == ParseState.READ_CHECKSUM:
-            expected_checksum = self.calculate_checksum()
-            received_checksum = byte_in
-            packet = None
-            if expected_checksum == received_checksum:
-                packet = {
-                    "function_code": self.function_code, 
-                    "data_length": self.data_length, 
-                    "data": self.data_buffer,
-                    "timestamp": time.time()
-                }
+    def feed(self, chunk):
+        """批量解析一段接收数据，返回其中所有完整且校验通过的数据包"""
+        buf = self._buffer
+        buf += chunk
+        pos = self._pos
+        packets = []
+        crc_errors = 0
+        # 同一批数据共用一个单调时钟时间戳，显示时再换算为本地时间
+        timestamp = time.monotonic()
+        
+        while True:
+            idx = buf.find(self.HEADER, pos)
+            if idx < 0:
+                # 末尾的0xAA可能是下一帧帧头的第一个字节，需保留（已作为上一帧校验字节消费的除外）
+                pos = max(pos, len(buf) - 1) if buf.endswith(b'\xAA') else len(buf)
+                break
+            if len(buf) < idx + 4:  # 功能码/长度尚未收全
+                pos = idx
+                break
+            data_length = buf[idx + 3]
+            end = idx + 5 + data_length
+            if len(buf) < end:  # 数据/校验尚未收全
+                pos = idx
+                break
+            
+            # 该CRC-8无输出异或，把接收到的校验字节一并计算，结果为0即校验通过
+            if checksum_crc8(buf[idx + 2:end]) == 0:
+                packets.append({
+                    "function_code": buf[idx + 2],
+                    "data_length": data_length,
+                    "data": buf[idx + 4:end - 1],
+                    "timestamp": timestamp
+                })
+                pos = end
             else:
-                raw_packet_hex = f"AA 55 {self.function_code:02X} {self.data_length:02X} {' '.join(f'{b:02X}' for b in self.data_buffer)} {received_checksum:02X}"
-                print(f"[CRC错误] 期望: {expected_checksum:02X}, 接收: {received_checksum:02X}, 数据: [{raw_packet_hex}]")
-            self._reset()
-            return packet
-        return None
+                crc_errors += 1
+                self.crc_error_count += 1
+                # 噪声较大时校验错误很多，只有需要打印时才格式化原始数据
+                if (self.crc_error_count - 1) % self.crc_error_log_every == 0:
+                    expected_checksum = checksum_crc8(buf[idx + 2:end - 1])
+                    received_checksum = buf[end - 1]
+                    raw_packet_hex = ' '.join(f'{b:02X}' for b in buf[idx:end])
+                    logger.error(f"[CRC错误] 期望: {expected_checksum:02X}, 接收: {received_checksum:02X}, 数据: [{raw_packet_hex}] (累计{self.crc_error_count}次)")
+                pos = idx + 1  # 从下一个字节重新寻找帧头
+        
+        if self.data_store is not None and (packets or crc_errors):
+            stats = self.data_store.stats
+            stats['total_packets'] += len(packets) + crc_errors
+            stats['valid_packets'] += len(packets)
+            stats['crc_errors'] += crc_errors
+        
+        if pos > self.COMPACT_THRESHOLD:
+            del buf[:pos]
+            pos = 0
+        self._pos = pos
+        return packets
+
+    def parse_byte(self, byte_in):
+        """逐字节解析（兼容旧接口），内部转发给feed
+
+        同一字节可能释放多个数据包（假帧头校验失败后重新同步），
+        此时每次调用只返回最早的一个，其余在后续调用中依次返回
+        """
+        pending = self._pending
+        pending.extend(self.feed(bytes((byte_in,))))
+        return pending.popleft() if pending else None
 
 # --- 数据存储类 ---
+# 脏标记位：解析器收到对应数据后置位，GUI刷新时检查并清零
+DIRTY_SYS = 1
+DIRTY_ENC = 2
+DIRTY_IMU = 4
+DIRTY_GAMEPAD = 8
+DIRTY_SBUS = 16
+DIRTY_KEY = 32
+DIRTY_STATS = 64
+
 class RobotDataStore:
     def __init__(self):
         self.reset_all_data()
@@ -127,21 +169,22 @@ class RobotDataStore:
             'last_update': None
         }
         
-        # 编码器数据 (批量)
+        # 编码器数据 (批量，按字段连续存放，下标即电机序号)
         self.encoder_data = {
-            'motor_0': {'id': 0, 'counter': 0, 'rps': 0.0, 'rpm': 0.0},
-            'motor_1': {'id': 1, 'counter': 0, 'rps': 0.0, 'rpm': 0.0},
-            'motor_2': {'id': 2, 'counter': 0, 'rps': 0.0, 'rpm': 0.0},
-            'motor_3': {'id': 3, 'counter': 0, 'rps': 0.0, 'rpm': 0.0},
+            'id': array('B', range(4)),
+            'counter': array('i', [0] * 4),
+            'rps': array('d', [0.0] * 4),
+            'rpm': array('d', [0.0] * 4),
             'last_update': None
         }
         
-        # IMU数据
+        # IMU数据 (float32连续存放: 加速度xyz + 陀螺仪xyz，与协议字节布局一致)
         self.imu_data = {
-            'accel': {'x': 0.0, 'y': 0.0, 'z': 0.0},
-            'gyro': {'x': 0.0, 'y': 0.0, 'z': 0.0},
+            'values': array('f', [0.0] * 6),
             'last_update': None
         }
+        # 数组的字节视图只建立一次，解析时直接整段拷贝进去
+        self.imu_bytes = memoryview(self.imu_data['values']).cast('B')
         
         # 手柄数据
         self.gamepad_data = {
@@ -162,13 +205,14 @@ class RobotDataStore:
         
         # SBUS遥控器
         self.sbus_data = {
-            'channels': [0] * 16,
+            'channels': array('h', [0] * 16),
             'ch17': 0,
             'ch18': 0,
             'signal_loss': False,
             'fail_safe': False,
             'last_update': None
         }
+        self.sbus_channel_bytes = memoryview(self.sbus_data['channels']).cast('B')
         
         # 总线舵机信息
         self.bus_servo_data = {
@@ -176,6 +220,12 @@ class RobotDataStore:
             'last_update': None
         }
         
+        # 自上次GUI刷新以来有更新的数据（DIRTY_*位组合）
+        self.dirty = 0
+        
+        # 数据包时间戳为time.monotonic()，加上该偏移即为墙上时间
+        self.clock_offset = time.time() - time.monotonic()
+        
         # 统计信息
         self.stats = {
             'total_packets': 0,
@@ -185,59 +235,98 @@ class RobotDataStore:
             'start_time': time.time()
         }
 
+# --- 数据包结构（预编译，避免每包重复解析格式字符串） ---
+_BATTERY = struct.Struct('<H')        # 电池电压(mV)
+_ENC_ALL = struct.Struct('<' + 'Bif' * 4)  # 4×(电机ID + 脉冲计数 + 转速RPS)
+_GAMEPAD = struct.Struct('<HB4b')     # 按键 + 方向键 + 左右摇杆
+_SBUS_TAIL = struct.Struct('<4B')     # ch17, ch18, 信号丢失, 失控保护
+_SBUS_CH_SIZE = 32                    # 16个int16通道值
+
+# 功能码名称（调试输出和统计页共用）
+_FUNC_NAMES = {
+    0x00: "系统信息", 0x06: "按键事件", 0x07: "IMU数据", 0x08: "总线舵机",
+    0x09: "IMU数据", 0x0A: "手柄数据", 0x0B: "编码器数据", 0x0C: "OLED控制"
+}
+
+# 高频状态类数据包：每包都是完整快照，一批中只需解析最新的一个
+# 功能码 -> 写入的数据槽（0x07和0x09都写IMU数据，共用一个槽；
+# 0x0B的编码器和SBUS数据靠长度区分，因此槽按(槽, 长度)分开记录）
+_LATEST_ONLY = {0x07: 0x09, 0x09: 0x09, 0x0A: 0x0A, 0x0B: 0x0B}
+
+# 按键事件类型
+_EVENT_NAMES = {
+    0x01: "按下", 0x02: "长按", 0x04: "长按重复", 0x08: "长按松开",
+    0x10: "短按松开", 0x20: "单击", 0x40: "双击", 0x80: "三连击"
+}
+
+# 协议为小端序；大端主机上直接拷贝进array后需要字节翻转
+_BIG_ENDIAN_HOST = sys.byteorder == 'big'
+
 # --- 数据解析器 ---
 class DataPacketHandler:
     def __init__(self, data_store):
         self.data_store = data_store
         
+        # 功能码 -> 解析函数，初始化时绑定一次，收包时直接查表分发
+        self.parsers = {
+            0x00: (self._parse_system_data,),    # 系统信息
+            0x06: (self._parse_key_event,),      # 按键事件
+            0x07: (self._parse_imu_data,),       # IMU数据 (24字节)
+            0x08: (self._parse_bus_servo_info,), # 总线舵机信息
+            0x09: (self._parse_imu_data,),       # IMU数据
+            0x0A: (self._parse_gamepad_data,),   # 手柄数据
+            0x0B: (self._parse_encoder_data,     # 编码器数据 (37字节)
+                   self._parse_sbus_data),
+        }
+        
     def handle_packet(self, packet):
-        func_code = packet['function_code']
-        data = packet['data']
-        timestamp = packet['timestamp']
-        
-        # 更新统计信息
-        self.data_store.stats['total_packets'] += 1
-        self.data_store.stats['valid_packets'] += 1
-        
-        if func_code not in self.data_store.stats['packet_counts']:
-            self.data_store.stats['packet_counts'][func_code] = 0
-        self.data_store.stats['packet_counts'][func_code] += 1
-        
-        # 调试信息：只对特定数据包类型显示（减少输出）
-        if func_code in [0x09, 0x0B] and self.data_store.stats['packet_counts'][func_code] % 50 == 1:  # 每50个包显示一次
-            func_names = {
-                0x00: "系统信息", 0x06: "按键事件", 0x07: "IMU数据", 0x08: "总线舵机",
-                0x09: "IMU数据", 0x0A: "手柄数据", 0x0B: "编码器数据", 0x0C: "OLED控制"
-            }
-            func_name = func_names.get(func_code, f"未知(0x{func_code:02X})")
-            print(f"[DEBUG] 接收到: {func_name} (0x{func_code:02X}), 长度: {len(data)}, 总计: {self.data_store.stats['packet_counts'][func_code]}")
+        self.handle_packets((packet,))
+    
+    def handle_packets(self, packets):
+        """批量处理数据包：每个包都计入统计，高频状态类数据包每个数据槽只解析最新的一个"""
+        if not packets:
+            return
+        stats = self.data_store.stats
+        packet_counts = stats['packet_counts']
+        parsers = self.parsers
+        latest = {}
+        
+        for packet in packets:
+            func_code = packet['function_code']
+            
+            # 更新各功能码计数（总帧数、有效帧数和校验错误数由解析器统计）
+            count = packet_counts.get(func_code, 0) + 1
+            packet_counts[func_code] = count
+            
+            # 调试信息：只对特定数据包类型显示（减少输出）
+            if func_code in [0x09, 0x0B] and count % 50 == 1:  # 每50个包显示一次
+                func_name = _FUNC_NAMES.get(func_code, f"未知(0x{func_code:02X})")
+                logger.debug(f"[DEBUG] 接收到: {func_name} (0x{func_code:02X}), 长度: {len(packet['data'])}, 总计: {count}")
+            
+            slot = _LATEST_ONLY.get(func_code)
+            if slot is not None:
+                latest[slot, len(packet['data'])] = packet  # 后到的覆盖先到的
+            else:
+                for parse in parsers.get(func_code, ()):
+                    parse(packet['data'], packet['timestamp'])
+        
+        self.data_store.dirty |= DIRTY_STATS
         
         # 根据功能码解析数据
-        if func_code == 0x00:  # 系统信息
-            self._parse_system_data(data, timestamp)
-        elif func_code == 0x06:  # 按键事件
-            self._parse_key_event(data, timestamp)
-        elif func_code == 0x07:  # IMU数据 (24字节)
-            self._parse_imu_data(data, timestamp)
-        elif func_code == 0x08:  # 总线舵机信息
-            self._parse_bus_servo_info(data, timestamp)
-        elif func_code == 0x09:  # IMU数据
-            self._parse_imu_data(data, timestamp)
-        elif func_code == 0x0A:  # 手柄数据
-            self._parse_gamepad_data(data, timestamp)
-        elif func_code == 0x0B:  # 编码器数据 (37字节)
-            self._parse_encoder_data(data, timestamp)
-            self._parse_sbus_data(data, timestamp)
+        for packet in latest.values():
+            for parse in parsers[packet['function_code']]:
+                parse(packet['data'], packet['timestamp'])
             
     def _parse_system_data(self, data, timestamp):
         """解析系统信息数据"""
         if len(data) >= 3:
             sub_cmd = data[0]
             if sub_cmd == 0x04:  # 电池电压
-                voltage_raw = struct.unpack('<H', data[1:3])[0]
+                voltage_raw = _BATTERY.unpack_from(data, 1)[0]
                 voltage_v = voltage_raw / 1000.0  # 转换为伏特
                 self.data_store.system_data['battery_voltage'] = voltage_v
                 self.data_store.system_data['last_update'] = timestamp
+                self.data_store.dirty |= DIRTY_SYS
                 
     def _parse_key_event(self, data, timestamp):
         """解析按键事件"""
@@ -245,61 +334,53 @@ class DataPacketHandler:
             key_id = data[0]
             event = data[1]
             
-            # 事件类型映射
-            event_names = {
-                0x01: "按下", 0x02: "长按", 0x04: "长按重复", 0x08: "长按松开",
-                0x10: "短按松开", 0x20: "单击", 0x40: "双击", 0x80: "三连击"
-            }
-            
             self.data_store.key_data.update({
                 'key_id': key_id,
                 'event': event,
-                'event_name': event_names.get(event, f"未知({event:02X})"),
+                'event_name': _EVENT_NAMES.get(event, f"未知({event:02X})"),
                 'last_update': timestamp
             })
+            self.data_store.dirty |= DIRTY_KEY
             
     def _parse_encoder_data(self, data, timestamp):
         """解析编码器数据"""            
         if len(data) == 37:  # 批量格式: 子命令(1) + 4个电机数据(4×9)
             sub_cmd = data[0]
             if sub_cmd == 0x10:  # 编码器批量上报
-                for motor_idx in range(4):
-                    offset = 1 + motor_idx * 9
-                    motor_data = data[offset:offset+9]
-                    
-                    if len(motor_data) == 9:
-                        motor_id, counter, rps = struct.unpack('<Bif', motor_data)
-                        rpm = rps * 60
-                        
-                        motor_key = f'motor_{motor_idx}'
-                        self.data_store.encoder_data[motor_key].update({
-                            'id': motor_id,
-                            'counter': counter,
-                            'rps': rps,
-                            'rpm': rpm
-                        })
-                        
-                self.data_store.encoder_data['last_update'] = timestamp
+                # 一次解出4个电机的数据，直接写入预分配的数组（不再循环/调用update）
+                (id0, cnt0, rps0, id1, cnt1, rps1,
+                 id2, cnt2, rps2, id3, cnt3, rps3) = _ENC_ALL.unpack_from(data, 1)
+                encoder_data = self.data_store.encoder_data
+                ids, counters = encoder_data['id'], encoder_data['counter']
+                rps, rpm = encoder_data['rps'], encoder_data['rpm']
+                
+                ids[0], counters[0], rps[0], rpm[0] = id0, cnt0, rps0, rps0 * 60
+                ids[1], counters[1], rps[1], rpm[1] = id1, cnt1, rps1, rps1 * 60
+                ids[2], counters[2], rps[2], rpm[2] = id2, cnt2, rps2, rps2 * 60
+                ids[3], counters[3], rps[3], rpm[3] = id3, cnt3, rps3, rps3 * 60
+                
+                encoder_data['last_update'] = timestamp
+                self.data_store.dirty |= DIRTY_ENC
         else:
-            print(f"[DEBUG] 编码器数据长度不匹配: 期望37字节，收到{len(data)}字节")
-            print(f"[DEBUG] 数据内容: {' '.join(f'{b:02X}' for b in data)}")
+            logger.debug(f"[DEBUG] 编码器数据长度不匹配: 期望37字节，收到{len(data)}字节")
+            logger.debug(f"[DEBUG] 数据内容: {' '.join(f'{b:02X}' for b in data)}")
                 
     def _parse_imu_data(self, data, timestamp):
         """解析IMU数据"""
         if len(data) == 24:  # 6个float: 加速度xyz + 陀螺仪xyz
-            values = struct.unpack('<6f', data)
-            self.data_store.imu_data.update({
-                'accel': {'x': values[0], 'y': values[1], 'z': values[2]},
-                'gyro': {'x': values[3], 'y': values[4], 'z': values[5]},
-                'last_update': timestamp
-            })
+            imu_data = self.data_store.imu_data
+            self.data_store.imu_bytes[:] = data  # 直接拷贝原始字节
+            if _BIG_ENDIAN_HOST:
+                imu_data['values'].byteswap()
+            imu_data['last_update'] = timestamp
+            self.data_store.dirty |= DIRTY_IMU
         else:
-            print(f"[DEBUG] IMU数据长度不匹配: 期望24字节，收到{len(data)}字节")
+            logger.debug(f"[DEBUG] IMU数据长度不匹配: 期望24字节，收到{len(data)}字节")
             
     def _parse_gamepad_data(self, data, timestamp):
         """解析手柄数据"""
         if len(data) == 7:
-            buttons, hat, lx, ly, rx, ry = struct.unpack('<HB4b', data)
+            buttons, hat, lx, ly, rx, ry = _GAMEPAD.unpack_from(data)
             self.data_store.gamepad_data.update({
                 'buttons': buttons,
                 'hat': hat,
@@ -307,21 +388,24 @@ class DataPacketHandler:
                 'right_stick': {'x': rx, 'y': ry},
                 'last_update': timestamp
             })
+            self.data_store.dirty |= DIRTY_GAMEPAD
             
     def _parse_sbus_data(self, data, timestamp):
         """解析SBUS数据"""
         if len(data) == 36:
-            channels = list(struct.unpack('<16h', data[0:32]))
-            ch17, ch18, signal_loss, fail_safe = struct.unpack('<4B', data[32:36])
+            self.data_store.sbus_channel_bytes[:] = data[:_SBUS_CH_SIZE]  # 直接拷贝原始字节
+            if _BIG_ENDIAN_HOST:
+                self.data_store.sbus_data['channels'].byteswap()
+            ch17, ch18, signal_loss, fail_safe = _SBUS_TAIL.unpack_from(data, _SBUS_CH_SIZE)
             
             self.data_store.sbus_data.update({
-                'channels': channels,
                 'ch17': ch17,
                 'ch18': ch18,
                 'signal_loss': bool(signal_loss),
                 'fail_safe': bool(fail_safe),
                 'last_update': timestamp
             })
+            self.data_store.dirty |= DIRTY_SBUS
             
     def _parse_bus_servo_info(self, data, timestamp):
         """解析总线舵机信息"""
@@ -333,8 +417,12 @@ class DataPacketHandler:
 
 # --- GUI显示器 ---
 class RobotDataGUI:
-    def __init__(self, data_store):
+    def __init__(self, data_store, process_packets=None, data_event=None):
+        load_gui()
         self.data_store = data_store
+        self.process_packets = process_packets  # 每次刷新前在GUI线程中调用，处理待处理的数据包
+        self.data_event = data_event  # 读线程收到数据时置位；为None时每次定时都刷新
+        self._time_cache = {}  # 面板名 -> (整数秒, 格式化后的时间字符串)
         self.root = tk.Tk()
         self.root.title("STM32机器人控制器数据监控器")
         self.root.geometry("1000x700")
@@ -408,6 +496,7 @@ class RobotDataGUI:
         
         # 创建表格
         columns = ('电机ID', '脉冲计数', '转速(RPS)', '转速(RPM)')
+        self.encoder_columns = columns
         self.encoder_tree = ttk.Treeview(frame, columns=columns, show='headings', height=8)
         
         for col in columns:
@@ -416,10 +505,12 @@ class RobotDataGUI:
             
         self.encoder_tree.pack(fill=tk.BOTH, expand=True, pady=10)
         
-        # 初始化行
+        # 初始化行，并记录每行当前显示的内容，刷新时只改动变化的单元格
+        self.encoder_shown = []
         for i in range(4):
-            self.encoder_tree.insert('', tk.END, iid=f'motor_{i}', 
-                                   values=(f'电机{i}', '0', '0.0000', '0.00'))
+            values = (f'电机{i}', '0', '0.0000', '0.00')
+            self.encoder_tree.insert('', tk.END, iid=f'motor_{i}', values=values)
+            self.encoder_shown.append(values)
         
         # 最后更新时间
         self.encoder_update_var = tk.StringVar(value="未更新")
@@ -554,61 +645,89 @@ class RobotDataGUI:
         counts_frame = ttk.LabelFrame(frame, text="数据包类型统计", padding=10)
         counts_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
-        self.counts_text = scrolledtext.ScrolledText(counts_frame, height=10, width=50)
+        # 只读：按行号就地更新计数，用户编辑会打乱行号与功能码的对应关系
+        self.counts_text = scrolledtext.ScrolledText(counts_frame, height=10, width=50, state=tk.DISABLED)
         self.counts_text.pack(fill=tk.BOTH, expand=True)
-        
+        self.count_lines = {}  # 功能码 -> [所在行号, 当前显示的计数]
+        
+    def _format_time(self, key, timestamp):
+        """将单调时钟时间戳格式化为本地时间HH:MM:SS，同一秒内直接复用上次的结果"""
+        sec = int(timestamp + self.data_store.clock_offset)
+        cached = self._time_cache.get(key)
+        if cached is None or cached[0] != sec:
+            t = time.localtime(sec)
+            cached = (sec, f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}")
+            self._time_cache[key] = cached
+        return cached[1]
+    
     def update_display(self):
         """更新GUI显示"""
         try:
+            # 取出并清零脏标记，只刷新自上次以来有新数据的面板
+            dirty = self.data_store.dirty
+            self.data_store.dirty = 0
+            
             # 更新系统信息
-            self.battery_var.set(f"{self.data_store.system_data['battery_voltage']:.2f}V")
-            if self.data_store.system_data['last_update']:
-                self.sys_update_var.set(datetime.fromtimestamp(self.data_store.system_data['last_update']).strftime("%H:%M:%S"))
+            if dirty & DIRTY_SYS:
+                self.battery_var.set(f"{self.data_store.system_data['battery_voltage']:.2f}V")
+                if self.data_store.system_data['last_update']:
+                    self.sys_update_var.set(self._format_time('system', self.data_store.system_data['last_update']))
             
             # 更新按键事件
-            self.key_id_var.set(str(self.data_store.key_data['key_id']))
-            self.key_event_var.set(self.data_store.key_data['event_name'])
-            if self.data_store.key_data['last_update']:
-                self.key_update_var.set(datetime.fromtimestamp(self.data_store.key_data['last_update']).strftime("%H:%M:%S"))
+            if dirty & DIRTY_KEY:
+                self.key_id_var.set(str(self.data_store.key_data['key_id']))
+                self.key_event_var.set(self.data_store.key_data['event_name'])
+                if self.data_store.key_data['last_update']:
+                    self.key_update_var.set(self._format_time('key', self.data_store.key_data['last_update']))
             
             # 更新编码器数据
-            for i in range(4):
-                motor_key = f'motor_{i}'
-                motor_data = self.data_store.encoder_data[motor_key]
-                self.encoder_tree.item(motor_key, values=(
-                    f"电机{motor_data['id']}",
-                    f"{motor_data['counter']:,}",
-                    f"{motor_data['rps']:.4f}",
-                    f"{motor_data['rpm']:.2f}"
-                ))
+            if dirty & DIRTY_ENC:
+                enc = self.data_store.encoder_data
+                for i in range(4):
+                    values = (
+                        f"电机{enc['id'][i]}",
+                        f"{enc['counter'][i]:,}",
+                        f"{enc['rps'][i]:.4f}",
+                        f"{enc['rpm'][i]:.2f}"
+                    )
+                    shown = self.encoder_shown[i]
+                    if values != shown:
+                        for column, value, old in zip(self.encoder_columns, values, shown):
+                            if value != old:
+                                self.encoder_tree.set(f'motor_{i}', column, value)
+                        self.encoder_shown[i] = values
             
-            if self.data_store.encoder_data['last_update']:
-                self.encoder_update_var.set(datetime.fromtimestamp(self.data_store.encoder_data['last_update']).strftime("%H:%M:%S"))
+                if self.data_store.encoder_data['last_update']:
+                    self.encoder_update_var.set(self._format_time('encoder', self.data_store.encoder_data['last_update']))
             
             # 更新IMU数据
-            for axis in ['x', 'y', 'z']:
-                self.accel_vars[axis].set(f"{self.data_store.imu_data['accel'][axis]:.3f}")
-                self.gyro_vars[axis].set(f"{self.data_store.imu_data['gyro'][axis]:.3f}")
+            if dirty & DIRTY_IMU:
+                imu_values = self.data_store.imu_data['values']
+                for i, axis in enumerate(['x', 'y', 'z']):
+                    self.accel_vars[axis].set(f"{imu_values[i]:.3f}")
+                    self.gyro_vars[axis].set(f"{imu_values[i + 3]:.3f}")
             
-            if self.data_store.imu_data['last_update']:
-                self.imu_update_var.set(datetime.fromtimestamp(self.data_store.imu_data['last_update']).strftime("%H:%M:%S"))
+                if self.data_store.imu_data['last_update']:
+                    self.imu_update_var.set(self._format_time('imu', self.data_store.imu_data['last_update']))
             
             # 更新手柄数据
-            self.gamepad_vars['buttons'].set(f"0x{self.data_store.gamepad_data['buttons']:04X}")
-            self.gamepad_vars['hat'].set(str(self.data_store.gamepad_data['hat']))
-            self.gamepad_vars['left_x'].set(str(self.data_store.gamepad_data['left_stick']['x']))
-            self.gamepad_vars['left_y'].set(str(self.data_store.gamepad_data['left_stick']['y']))
-            self.gamepad_vars['right_x'].set(str(self.data_store.gamepad_data['right_stick']['x']))
-            self.gamepad_vars['right_y'].set(str(self.data_store.gamepad_data['right_stick']['y']))
+            if dirty & DIRTY_GAMEPAD:
+                self.gamepad_vars['buttons'].set(f"0x{self.data_store.gamepad_data['buttons']:04X}")
+                self.gamepad_vars['hat'].set(str(self.data_store.gamepad_data['hat']))
+                self.gamepad_vars['left_x'].set(str(self.data_store.gamepad_data['left_stick']['x']))
+                self.gamepad_vars['left_y'].set(str(self.data_store.gamepad_data['left_stick']['y']))
+                self.gamepad_vars['right_x'].set(str(self.data_store.gamepad_data['right_stick']['x']))
+                self.gamepad_vars['right_y'].set(str(self.data_store.gamepad_data['right_stick']['y']))
             
             # 更新SBUS数据
-            for i in range(4):
-                self.sbus_vars[f'ch{i+1}'].set(str(self.data_store.sbus_data['channels'][i]))
+            if dirty & DIRTY_SBUS:
+                for i in range(4):
+                    self.sbus_vars[f'ch{i+1}'].set(str(self.data_store.sbus_data['channels'][i]))
             
-            self.sbus_vars['signal_loss'].set("信号丢失" if self.data_store.sbus_data['signal_loss'] else "正常")
-            self.sbus_vars['fail_safe'].set("失控保护" if self.data_store.sbus_data['fail_safe'] else "正常")
+                self.sbus_vars['signal_loss'].set("信号丢失" if self.data_store.sbus_data['signal_loss'] else "正常")
+                self.sbus_vars['fail_safe'].set("失控保护" if self.data_store.sbus_data['fail_safe'] else "正常")
             
-            # 更新统计信息
+            # 更新统计信息（总帧数/有效帧数/校验错误由读线程累加，不经过脏标记，每次都刷新）
             stats = self.data_store.stats
             self.stats_vars['total_packets'].set(str(stats['total_packets']))
             self.stats_vars['valid_packets'].set(str(stats['valid_packets']))
@@ -618,71 +737,96 @@ class RobotDataGUI:
                 success_rate = stats['valid_packets'] / stats['total_packets'] * 100
                 self.stats_vars['success_rate'].set(f"{success_rate:.1f}%")
             
-            runtime = int(time.time() - stats['start_time'])
-            hours, remainder = divmod(runtime, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            self.stats_vars['runtime'].set(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+            # 运行时间与数据无关，每次都刷新
+            self.update_runtime()
             
             # 更新数据包计数
-            self.counts_text.delete(1.0, tk.END)
-            func_names = {
-                0x00: "系统信息", 0x06: "按键事件", 0x07: "编码器数据", 0x08: "总线舵机",
-                0x09: "IMU数据", 0x0A: "手柄数据", 0x0B: "SBUS数据", 0x0C: "OLED控制"
-            }
-            
-            for func_code, count in stats['packet_counts'].items():
-                name = func_names.get(func_code, f"未知(0x{func_code:02X})")
-                self.counts_text.insert(tk.END, f"{name}: {count}\n")
+            # 每个功能码占固定一行（新功能码追加到末尾），只替换计数变化的行
+            if dirty & DIRTY_STATS:
+                editing = False  # 控件只读，有行需要改动时才临时切换为可编辑
+                for func_code, count in stats['packet_counts'].items():
+                    line = self.count_lines.get(func_code)
+                    if line is not None and line[1] == count:
+                        continue
+                    if not editing:
+                        self.counts_text.configure(state=tk.NORMAL)
+                        editing = True
+                    name = _FUNC_NAMES.get(func_code, f"未知(0x{func_code:02X})")
+                    if line is None:
+                        self.counts_text.insert(tk.END, f"{name}: {count}\n")
+                        self.count_lines[func_code] = [len(self.count_lines) + 1, count]
+                    else:
+                        self.counts_text.replace(f"{line[0]}.0", f"{line[0]}.end", f"{name}: {count}")
+                        line[1] = count
+                if editing:
+                    self.counts_text.configure(state=tk.DISABLED)
                 
         except Exception as e:
-            print(f"GUI更新错误: {e}")
+            logger.error(f"GUI更新错误: {e}")
+    
+    def update_runtime(self):
+        """更新运行时间"""
+        runtime = int(time.time() - self.data_store.stats['start_time'])
+        hours, remainder = divmod(runtime, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        self.stats_vars['runtime'].set(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
     
     def update_timer(self):
-        """定时更新GUI"""
-        self.update_display()
-        self.root.after(100, self.update_timer)  # 每100ms更新一次
+        """定时更新GUI：有新数据时每50ms刷新一次，空闲时每200ms只刷新运行时间"""
+        if self.data_event is None or self.data_event.is_set():
+            if self.data_event is not None:
+                self.data_event.clear()  # 先清除，处理期间到达的数据会重新置位
+            if self.process_packets:
+                # 处理出错时只记录，保证下面的刷新和重新调度照常进行
+                try:
+                    self.process_packets()
+                except Exception as e:
+                    logger.error(f"❌ 数据处理错误: {e}")
+            self.update_display()
+            self.root.after(50, self.update_timer)
+        else:
+            self.update_runtime()
+            self.root.after(200, self.update_timer)
         
     def run(self):
         """运行GUI"""
         self.root.mainloop()
 
 # --- 终端显示器 ---
+CLEAR_SCREEN = "\x1b[2J\x1b[H"  # ANSI清屏并将光标移到左上角
+TERMINAL_HEADER = "=" * 80 + "\nSTM32机器人控制器数据监控器\n" + "=" * 80
+
 class TerminalDisplay:
+    REFRESH_INTERVAL = 1.0  # 刷新间隔(秒)，每次刷新都会清屏，不宜过快
+    
     def __init__(self, data_store):
         self.data_store = data_store
-        self.last_display_time = 0
+        self.last_frame = None
+        self._write = sys.stdout.write
+        self._flush = sys.stdout.flush
+        if os.name == 'nt':
+            os.system('')  # 启用Windows控制台的ANSI转义序列支持
         
     def display(self):
-        """终端显示数据"""
-        current_time = time.time()
-        if current_time - self.last_display_time < 1.0:  # 每秒更新一次
-            return
-            
-        self.last_display_time = current_time
-        
-        # 清屏
-        os.system('cls' if os.name == 'nt' else 'clear')
-        
-        print("=" * 80)
-        print("STM32机器人控制器数据监控器")
-        print("=" * 80)
+        """终端显示数据：整帧拼成一个字符串一次写出，内容与上一帧相同时不重绘"""
+        lines = [TERMINAL_HEADER]
         
         # 系统信息
-        print(f"电池电压: {self.data_store.system_data['battery_voltage']:.2f}V")
+        lines.append(f"电池电压: {self.data_store.system_data['battery_voltage']:.2f}V")
         
         # 编码器数据
-        print("\n编码器数据:")
-        print("电机ID | 脉冲计数    | 转速(RPS) | 转速(RPM)")
-        print("-" * 50)
+        lines.append("\n编码器数据:")
+        lines.append("电机ID | 脉冲计数    | 转速(RPS) | 转速(RPM)")
+        lines.append("-" * 50)
+        enc = self.data_store.encoder_data
         for i in range(4):
-            motor_data = self.data_store.encoder_data[f'motor_{i}']
-            print(f"电机{motor_data['id']}  | {motor_data['counter']:10,} | {motor_data['rps']:8.4f} | {motor_data['rpm']:8.2f}")
+            lines.append(f"电机{enc['id'][i]}  | {enc['counter'][i]:10,} | {enc['rps'][i]:8.4f} | {enc['rpm'][i]:8.2f}")
         
         # IMU数据
-        imu = self.data_store.imu_data
-        print(f"\nIMU数据:")
-        print(f"加速度: X={imu['accel']['x']:7.3f} Y={imu['accel']['y']:7.3f} Z={imu['accel']['z']:7.3f} m/s²")
-        print(f"陀螺仪: X={imu['gyro']['x']:7.3f} Y={imu['gyro']['y']:7.3f} Z={imu['gyro']['z']:7.3f} rad/s")
+        imu = self.data_store.imu_data['values']
+        lines.append(f"\nIMU数据:")
+        lines.append(f"加速度: X={imu[0]:7.3f} Y={imu[1]:7.3f} Z={imu[2]:7.3f} m/s²")
+        lines.append(f"陀螺仪: X={imu[3]:7.3f} Y={imu[4]:7.3f} Z={imu[5]:7.3f} rad/s")
         
         # 统计信息
         stats = self.data_store.stats
@@ -690,31 +834,53 @@ class TerminalDisplay:
         hours, remainder = divmod(runtime, 3600)
         minutes, seconds = divmod(remainder, 60)
         
-        print(f"\n统计信息:")
-        print(f"运行时间: {hours:02d}:{minutes:02d}:{seconds:02d}")
-        print(f"总包数: {stats['total_packets']} | 有效包: {stats['valid_packets']} | 错误包: {stats['crc_errors']}")
+        lines.append(f"\n统计信息:")
+        lines.append(f"运行时间: {hours:02d}:{minutes:02d}:{seconds:02d}")
+        lines.append(f"总包数: {stats['total_packets']} | 有效包: {stats['valid_packets']} | 错误包: {stats['crc_errors']}")
         
         if stats['total_packets'] > 0:
             success_rate = stats['valid_packets'] / stats['total_packets'] * 100
-            print(f"成功率: {success_rate:.1f}%")
+            lines.append(f"成功率: {success_rate:.1f}%")
+        
+        frame = "\n".join(lines) + "\n"
+        if frame == self.last_frame:
+            return
+        self.last_frame = frame
+        
+        # 清屏序列与整帧一起写出，不再启动cls/clear子进程
+        self._write(CLEAR_SCREEN + frame)
+        self._flush()
 
 # --- 主监控类 ---
 class RobotDataMonitor:
-    def __init__(self, com_port='COM21', baud_rate=1000000, use_gui=True):
+    READ_CHUNK_MAX = 65536  # 单次读取的字节上限，避免突发数据时一次解析过多导致界面卡顿
+    
+    def __init__(self, com_port='COM21', baud_rate=1000000, use_gui=True, reader_cpu=None):
         self.com_port = com_port
         self.baud_rate = baud_rate
-        self.use_gui = use_gui and GUI_AVAILABLE
+        self.use_gui = use_gui and load_gui()
+        self.reader_cpu = reader_cpu  # 读线程绑定的CPU核心，None表示不绑定
         
         self.data_store = RobotDataStore()
-        self.parser = RrcProtocolParser()
+        self.parser = RrcProtocolParser(self.data_store)
         self.handler = DataPacketHandler(self.data_store)
         
         self.serial_conn = None
         self.running = False
         self.read_thread = None
         
+        # GUI模式下读线程只负责收包，数据包经此队列交给Tk线程处理
+        # （deque的appendleft/pop在GIL下是原子的，无需加锁；队列满时丢弃最旧的包）
+        self.packet_queue = collections.deque(maxlen=4096)
+        self.data_event = threading.Event()  # 读线程收到数据后置位，GUI据此决定是否刷新
+        self.display_dirty = False  # 终端模式：读线程收到数据后置位，主线程据此刷新显示
+        self._stop_event = threading.Event()  # 停止监控或串口出错时置位，唤醒终端模式的主线程退出
+        
+        self.log_handler = None   # run()期间挂在logger上的队列处理器
+        self.log_listener = None  # 后台输出日志的监听线程
+        
         if self.use_gui:
-            self.gui = RobotDataGUI(self.data_store)
+            self.gui = RobotDataGUI(self.data_store, self.process_pending_packets, self.data_event)
         else:
             self.terminal_display = TerminalDisplay(self.data_store)
         
@@ -724,48 +890,100 @@ class RobotDataMonitor:
             self.serial_conn = serial.Serial(
                 port=self.com_port,
                 baudrate=self.baud_rate,
-                timeout=1.0
+                timeout=0.005  # 空闲时的单字节读取不长时间阻塞，停止监控时也能及时退出
             )
-            print(f"✅ 成功连接到 {self.com_port} (波特率: {self.baud_rate})")
+            if os.name == 'nt':
+                # Windows驱动默认接收缓冲区只有4KB，加大后突发数据能在驱动中排队而不丢失
+                self.serial_conn.set_buffer_size(rx_size=self.READ_CHUNK_MAX)
+            logger.info(f"✅ 成功连接到 {self.com_port} (波特率: {self.baud_rate})")
             return True
         except serial.SerialException as e:
-            print(f"❌ 串口连接失败: {e}")
+            logger.error(f"❌ 串口连接失败: {e}")
             return False
     
     def disconnect_serial(self):
         """断开串口连接"""
         if self.serial_conn and self.serial_conn.is_open:
             self.serial_conn.close()
-            print("🔌 串口已断开")
+            logger.info("🔌 串口已断开")
+    
+    def setup_reader_thread(self):
+        """将当前(读)线程绑定到reader_cpu并提高调度优先级，失败时保持默认调度"""
+        import ctypes
+        try:
+            if os.name == 'nt':
+                kernel32 = ctypes.windll.kernel32
+                thread = kernel32.GetCurrentThread()
+                # 两个API失败时都返回0；掩码按DWORD_PTR传入，超出范围的核心号会得到0掩码而失败
+                if not kernel32.SetThreadAffinityMask(thread, ctypes.c_size_t(1 << self.reader_cpu)):
+                    raise ctypes.WinError()
+                if not kernel32.SetThreadPriority(thread, 15):  # THREAD_PRIORITY_TIME_CRITICAL
+                    logger.warning(f"⚠️  读线程优先级设置失败: {ctypes.WinError()}")
+            else:
+                # Linux下pid为0时只作用于调用线程
+                os.sched_setaffinity(0, {self.reader_cpu})
+                try:
+                    os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+                except PermissionError:
+                    logger.warning("⚠️  无实时调度权限(需root)，读线程保持普通优先级")
+            logger.info(f"📌 读线程已绑定到CPU{self.reader_cpu}")
+        except (AttributeError, OSError, ValueError, ctypes.ArgumentError) as e:
+            logger.warning(f"⚠️  读线程CPU绑定失败: {e}")
     
     def read_data_loop(self):
         """数据读取循环"""
-        print("🔄 开始监听数据...")
+        logger.info("🔄 开始监听数据...")
+        if self.reader_cpu is not None:
+            self.setup_reader_thread()
         
         while self.running:
             try:
-                byte_data = self.serial_conn.read(1)
+                # 一次读出串口缓冲区中已有的全部数据，交给解析器批量分帧
+                waiting = self.serial_conn.in_waiting
+                byte_data = self.serial_conn.read(min(waiting, self.READ_CHUNK_MAX) if waiting else 1)
                 if byte_data:
-                    packet = self.parser.parse_byte(byte_data[0])
-                    if packet:
-                        self.handler.handle_packet(packet)
-                        
-                        # 如果使用终端显示，只在接收到完整数据包时更新
-                        if not self.use_gui:
-                            self.terminal_display.display()
+                    packets = self.parser.feed(byte_data)
+                    if self.use_gui:
+                        # 整批入队（extendleft后最旧的包仍在右端，pop()保持先进先出）
+                        self.packet_queue.extendleft(packets)
+                        # 校验错误也会改变统计数据，因此只要收到数据就通知GUI
+                        if not self.data_event.is_set():
+                            self.data_event.set()
+                    else:
+                        self.handler.handle_packets(packets)
+                        # 只做标记，由主线程按固定节奏刷新终端显示
+                        self.display_dirty = True
                     
             except serial.SerialException as e:
-                print(f"❌ 串口读取错误: {e}")
+                logger.error(f"❌ 串口读取错误: {e}")
+                self._stop_event.set()
                 break
             except Exception as e:
-                print(f"❌ 数据处理错误: {e}")
+                logger.error(f"❌ 数据处理错误: {e}")
                 continue
     
+    def process_pending_packets(self):
+        """处理读线程放入队列的数据包（在GUI线程中调用）"""
+        pending = self.packet_queue
+        packets = []
+        for _ in range(len(pending)):
+            try:
+                packets.append(pending.pop())
+            except IndexError:
+                break
+        self.handler.handle_packets(packets)
+    
     def start_monitoring(self):
         """开始监控"""
         if not self.connect_serial():
             return False
             
+        # 启动阶段创建的对象(GUI控件等)移入永久代，之后的垃圾回收不再扫描它们，减少对读线程的停顿
+        # 与CPU绑定一样属于读线程实时性调优，只在指定--cpu时启用
+        if self.reader_cpu is not None:
+            gc.freeze()
+        
+        self._stop_event.clear()  # 上一次监控停止时置位过，重新开始前先清除
         self.running = True
         self.read_thread = threading.Thread(target=self.read_data_loop, daemon=True)
         self.read_thread.start()
@@ -775,32 +993,62 @@ class RobotDataMonitor:
     def stop_monitoring(self):
         """停止监控"""
         self.running = False
+        self._stop_event.set()
         if self.read_thread:
             self.read_thread.join(timeout=2.0)
         self.disconnect_serial()
-        print("🛑 监控已停止")
+        logger.info("🛑 监控已停止")
+        self.stop_logging()
+    
+    def start_logging(self):
+        """日志先放入队列，由后台监听线程格式化输出，读线程不会因终端I/O阻塞"""
+        if self.log_listener is not None:
+            return
+        log_queue = queue.SimpleQueue()
+        log_output = logging.StreamHandler(sys.stdout)
+        log_output.setFormatter(logging.Formatter('%(message)s'))
+        self.log_handler = logging.handlers.QueueHandler(log_queue)
+        self.log_listener = logging.handlers.QueueListener(log_queue, log_output)
+        logger.addHandler(self.log_handler)
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        self.log_listener.start()
+    
+    def stop_logging(self):
+        """摘除队列处理器，输出队列中剩余的日志后结束监听线程（可重复调用）"""
+        if self.log_listener is None:
+            return
+        logger.removeHandler(self.log_handler)
+        logger.propagate = True
+        self.log_listener.stop()
+        self.log_handler = None
+        self.log_listener = None
     
     def run(self):
         """运行监控器"""
+        self.start_logging()
         try:
             if not self.start_monitoring():
                 return
             
             if self.use_gui:
-                print("🖥️  启动GUI界面...")
+                logger.info("🖥️  启动GUI界面...")
                 self.gui.run()
             else:
-                print("⌨️  使用终端显示模式... (按Ctrl+C停止)")
+                logger.info("⌨️  使用终端显示模式... (按Ctrl+C停止)")
                 try:
-                    while True:
-                        time.sleep(0.1)
+                    # wait()超时即刷新一次显示；收到停止信号时立即返回True并退出循环
+                    while not self._stop_event.wait(TerminalDisplay.REFRESH_INTERVAL):
+                        if self.display_dirty:
+                            self.display_dirty = False
+                            self.terminal_display.display()
                 except KeyboardInterrupt:
-                    print("\n用户中断")
+                    logger.info("\n用户中断")
                     
         except KeyboardInterrupt:
-            print("\n用户中断")
+            logger.info("\n用户中断")
         except Exception as e:
-            print(f"❌ 运行错误: {e}")
+            logger.error(f"❌ 运行错误: {e}")
         finally:
             self.stop_monitoring()
 
@@ -808,26 +1056,37 @@ class RobotDataMonitor:
 def main():
     import argparse
     
+    def cpu_index(value):
+        """--cpu参数检查：CPU核心编号必须是非负整数"""
+        cpu = int(value)
+        if cpu < 0:
+            raise argparse.ArgumentTypeError(f"CPU核心编号不能为负数: {value}")
+        return cpu
+    
     parser = argparse.ArgumentParser(description='STM32机器人控制器数据监控器')
     parser.add_argument('--port', default='COM21', help='串口号 (默认: COM21)')
     parser.add_argument('--baud', type=int, default=1000000, help='波特率 (默认: 1000000)')
     parser.add_argument('--terminal', action='store_true', help='使用终端显示模式')
+    parser.add_argument('--cpu', type=cpu_index, default=None, help='将串口读取线程绑定到指定CPU核心并提高其优先级')
     
     args = parser.parse_args()
     
-    use_gui = not args.terminal
+    use_gui = not args.terminal and load_gui()
     
     print("🤖 STM32机器人控制器数据监控器")
     print("=" * 50)
     print(f"串口: {args.port}")
     print(f"波特率: {args.baud}")
-    print(f"显示模式: {'GUI' if use_gui and GUI_AVAILABLE else '终端'}")
+    print(f"显示模式: {'GUI' if use_gui else '终端'}")
+    if args.cpu is not None:
+        print(f"读线程CPU: {args.cpu}")
     print("=" * 50)
     
     monitor = RobotDataMonitor(
         com_port=args.port,
         baud_rate=args.baud,
-        use_gui=use_gui
+        use_gui=use_gui,
+        reader_cpu=args.cpu
     )
     
     monitor.run()